@@ -0,0 +1,32 @@
+"""
+JSON parsing helpers shared across JSCOM common modules.
+
+Uses orjson when available and falls back to the standard library json module
+for environments where orjson wheels aren't available.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Deserialize JSON from bytes or a string.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Deserialized Python object
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
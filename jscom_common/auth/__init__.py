@@ -1,5 +1,5 @@
 """Authentication utilities for JSCOM services."""
 
-from jscom_common.auth.cognito import get_jwks, validate_jwt_token
+from jscom_common.auth.cognito import get_jwks, get_jwks_index, get_signing_key, validate_jwt_token, warmup
 
-__all__ = ["get_jwks", "validate_jwt_token"]
+__all__ = ["get_jwks", "get_jwks_index", "get_signing_key", "validate_jwt_token", "warmup"]
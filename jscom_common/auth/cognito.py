@@ -1,53 +1,460 @@
 """AWS Cognito JWT token validation utilities for JSCOM services."""
 
+import base64
+import copy
+import hashlib
 import os
-from typing import Any
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
-import requests
+import urllib3
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools.event_handler.exceptions import UnauthorizedError
-from jose import JWTError, jwt
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey, RSAPublicNumbers
+from jwt import (
+    DecodeError,
+    ExpiredSignatureError,
+    ImmatureSignatureError,
+    InvalidAudienceError,
+    InvalidIssuerError,
+    InvalidSignatureError,
+    InvalidTokenError,
+    MissingRequiredClaimError,
+)
+
+from jscom_common import _json
 
 # Initialize logger
 logger = Logger(child=True)
 
-# Cache for JWKS (JSON Web Key Set)
-_jwks_cache: dict[str, Any] | None = None
+# Shared connection pool so warm containers reuse the TLS connection to Cognito
+_http = urllib3.PoolManager(maxsize=4, retries=urllib3.Retry(total=2))
+
+# How long a fetched JWKS is served before it must be refetched
+_JWKS_TTL_SECONDS = 3600
+
+# Window before expiry in which a background refresh is started
+_JWKS_REFRESH_AHEAD_SECONDS = 300
+
+# How long stale keys are served after a failed refresh before retrying
+_JWKS_RETRY_SECONDS = 30
+
+
+class _JwksEntry(NamedTuple):
+    """Cached JWKS with its keys indexed by kid, the constructed RSA keys, and refresh timestamps."""
+
+    expires_at: float
+    refresh_at: float
+    jwks: Mapping[str, Any]
+    keys_by_kid: Mapping[str, Mapping[str, Any]]
+    public_keys: Mapping[str, RSAPublicKey]
+
+
+# Maximum number of user pools kept in _jwks_cache
+_JWKS_CACHE_SIZE = 16
+
+# LRU cache for JWKS (JSON Web Key Set) keyed by (region, user_pool_id)
+_jwks_cache: OrderedDict[tuple[str, str], _JwksEntry] = OrderedDict()
+
+# Per-pool locks ensuring only one thread fetches a pool's JWKS at a time
+_jwks_locks: dict[tuple[str, str], threading.Lock] = {}
+
+# Expected token issuer keyed by (region, user_pool_id)
+_issuer_cache: dict[tuple[str, str], str] = {}
+
+# Authorization header value "Bearer <token>", capturing a token of base64url segments
+_BEARER_RE = re.compile(r"bearer\s+([A-Za-z0-9._\-]+)\s*", re.IGNORECASE)
+
+# Maximum number of verified tokens kept in _verified_token_cache
+_VERIFIED_TOKEN_CACHE_SIZE = 1024
+
+# LRU cache of verified token claims keyed by (token digest, issuer, audience), storing (exp, claims)
+_verified_token_cache: OrderedDict[tuple[bytes, str, str], tuple[float, dict[str, Any]]] = OrderedDict()
 
 
 def get_jwks(
     region: str | None = None,
     user_pool_id: str | None = None,
-) -> dict[str, Any]:
+) -> Mapping[str, Any]:
     """
     Fetch and cache the JWKS from Cognito.
 
+    The JWKS is cached per user pool for an hour and refreshed in the background
+    shortly before it expires. If a refresh fails while cached keys exist, the stale keys are
+    served and the fetch is retried after a short delay.
+
+    The cached JWKS is shared across callers and is read-only throughout: JWKs are
+    read-only mappings and the "keys" list is a tuple.
+
     Args:
         region: AWS region for Cognito (defaults to COGNITO_REGION env var or us-west-2)
         user_pool_id: Cognito User Pool ID (defaults to COGNITO_USER_POOL_ID env var)
 
     Returns:
-        JWKS dictionary from Cognito
+        Read-only JWKS mapping from Cognito
 
     Raises:
-        requests.RequestException: If JWKS fetch fails
+        urllib3.exceptions.HTTPError: If JWKS fetch fails and no cached JWKS is available
     """
-    global _jwks_cache
+    return _get_jwks_entry(region=region, user_pool_id=user_pool_id).jwks
 
-    if _jwks_cache is None:
-        cognito_region = region or os.environ.get("COGNITO_REGION", "us-west-2")
-        cognito_user_pool_id = user_pool_id or os.environ.get("COGNITO_USER_POOL_ID", "")
 
-        if not cognito_user_pool_id:
-            raise ValueError("COGNITO_USER_POOL_ID environment variable or user_pool_id parameter is required")
+def get_jwks_index(
+    region: str | None = None,
+    user_pool_id: str | None = None,
+) -> Mapping[str, Mapping[str, Any]]:
+    """
+    Return the cached JWKS keys indexed by key ID (kid).
+
+    The index is built once when the JWKS is fetched, so key lookups during
+    token validation are a single dictionary probe.
+
+    Args:
+        region: AWS region for Cognito (defaults to COGNITO_REGION env var or us-west-2)
+        user_pool_id: Cognito User Pool ID (defaults to COGNITO_USER_POOL_ID env var)
+
+    Returns:
+        Read-only mapping of key ID to read-only JWK mapping
+
+    Raises:
+        urllib3.exceptions.HTTPError: If JWKS fetch fails and no cached JWKS is available
+    """
+    return _get_jwks_entry(region=region, user_pool_id=user_pool_id).keys_by_kid
+
+
+def get_signing_key(
+    kid: str,
+    region: str | None = None,
+    user_pool_id: str | None = None,
+) -> RSAPublicKey:
+    """
+    Return the RSA public key for a key ID (kid).
 
-        jwks_url = f"https://cognito-idp.{cognito_region}.amazonaws.com/{cognito_user_pool_id}/.well-known/jwks.json"
-        logger.info(f"Fetching JWKS from {jwks_url}")
-        response = requests.get(jwks_url, timeout=10)
-        response.raise_for_status()
-        _jwks_cache = response.json()
+    Keys are constructed once when the JWKS is fetched, so this is a single
+    dictionary lookup on the cached JWKS.
+
+    Args:
+        kid: Key ID from the token header
+        region: AWS region for Cognito (defaults to COGNITO_REGION env var or us-west-2)
+        user_pool_id: Cognito User Pool ID (defaults to COGNITO_USER_POOL_ID env var)
+
+    Returns:
+        RSA public key for verifying RS256 signatures
+
+    Raises:
+        KeyError: If the JWKS has no RSA key with the given kid
+        urllib3.exceptions.HTTPError: If JWKS fetch fails and no cached JWKS is available
+    """
+    return _get_jwks_entry(region=region, user_pool_id=user_pool_id).public_keys[kid]
+
+
+def warmup(
+    region: str | None = None,
+    user_pool_id: str | None = None,
+) -> None:
+    """
+    Prime the JWKS, signing key and issuer caches for a user pool.
+
+    Call this during Lambda initialization (at module level, outside the handler)
+    so the JWKS fetch and key construction happen during cold start rather than
+    on the first request's critical path.
+
+    Args:
+        region: AWS region for Cognito (defaults to COGNITO_REGION env var or us-west-2)
+        user_pool_id: Cognito User Pool ID (defaults to COGNITO_USER_POOL_ID env var)
+
+    Raises:
+        urllib3.exceptions.HTTPError: If JWKS fetch fails
+
+    Examples:
+        >>> from jscom_common.auth import validate_jwt_token, warmup
+        >>> warmup()
+        >>> def lambda_handler(event, context):
+        ...     claims = validate_jwt_token(event)
+    """
+    cognito_region, cognito_user_pool_id = _resolve_pool(region, user_pool_id)
+    _get_jwks_entry(region=cognito_region, user_pool_id=cognito_user_pool_id)
+    _get_issuer(cognito_region, cognito_user_pool_id)
+
+
+def _get_jwks_entry(
+    region: str | None,
+    user_pool_id: str | None,
+) -> _JwksEntry:
+    """Return the cached JWKS entry for a user pool, fetching or refreshing it as needed."""
+    pool_key = _resolve_pool(region, user_pool_id)
+    cached = _jwks_cache.get(pool_key)
+    now = time.time()
+
+    if cached is not None and now < cached.expires_at:
+        try:
+            _jwks_cache.move_to_end(pool_key)
+        except KeyError:
+            # Evicted by another thread since the lookup; the entry is still valid
+            pass
+        if now >= cached.refresh_at:
+            _start_background_refresh(pool_key)
+        return cached
+
+    with _get_jwks_lock(pool_key):
+        # Another thread may have fetched the JWKS while we waited for the lock
+        cached = _jwks_cache.get(pool_key)
+        if cached is not None and time.time() < cached.expires_at:
+            return cached
+
+        try:
+            return _fetch_jwks(pool_key)
+        except Exception as e:
+            if cached is None:
+                raise
+            logger.warning(f"JWKS refresh failed, serving stale keys: {e}")
+            retry_at = time.time() + _JWKS_RETRY_SECONDS
+            stale = cached._replace(expires_at=retry_at, refresh_at=retry_at)
+            _jwks_cache[pool_key] = stale
+            return stale
+
+
+def _resolve_pool(region: str | None, user_pool_id: str | None) -> tuple[str, str]:
+    """Resolve the Cognito region and user pool ID from parameters or environment variables."""
+    cognito_region = region or os.environ.get("COGNITO_REGION", "us-west-2")
+    cognito_user_pool_id = user_pool_id or os.environ.get("COGNITO_USER_POOL_ID", "")
+
+    if not cognito_user_pool_id:
+        raise ValueError("COGNITO_USER_POOL_ID environment variable or user_pool_id parameter is required")
 
-    return _jwks_cache
+    return cognito_region, cognito_user_pool_id
+
+
+def _get_issuer(cognito_region: str, cognito_user_pool_id: str) -> str:
+    """Return the expected token issuer for a user pool."""
+    issuer_cache_key = (cognito_region, cognito_user_pool_id)
+    issuer = _issuer_cache.get(issuer_cache_key)
+    if issuer is None:
+        issuer = f"https://cognito-idp.{cognito_region}.amazonaws.com/{cognito_user_pool_id}"
+        _issuer_cache[issuer_cache_key] = issuer
+    return issuer
+
+
+def _get_jwks_lock(pool_key: tuple[str, str]) -> threading.Lock:
+    """Return the fetch lock for a user pool."""
+    lock = _jwks_locks.get(pool_key)
+    if lock is None:
+        lock = _jwks_locks.setdefault(pool_key, threading.Lock())
+    return lock
+
+
+def _fetch_jwks(pool_key: tuple[str, str]) -> _JwksEntry:
+    """Fetch a user pool's JWKS from Cognito and store it in the cache."""
+    cognito_region, cognito_user_pool_id = pool_key
+    jwks_url = f"https://cognito-idp.{cognito_region}.amazonaws.com/{cognito_user_pool_id}/.well-known/jwks.json"
+
+    logger.info(f"Fetching JWKS from {jwks_url}")
+    response = _http.request("GET", jwks_url, timeout=10.0, headers={"Accept-Encoding": "gzip"})
+    if response.status != 200:
+        raise urllib3.exceptions.HTTPError(f"JWKS fetch failed with status {response.status}")
+
+    jwks: Mapping[str, Any] = _freeze(_json.loads(response.data))
+    jwks_index = {jwk_key["kid"]: jwk_key for jwk_key in jwks["keys"]}
+
+    # Construct the RSA keys once per fetch rather than once per validated token
+    public_keys: dict[str, RSAPublicKey] = {}
+    for kid, jwk_key in jwks_index.items():
+        if jwk_key.get("kty") != "RSA":
+            continue
+        try:
+            public_keys[kid] = _build_public_key(jwk_key)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping unusable JWKS key {kid}: {e}")
+
+    expires_at = time.time() + _JWKS_TTL_SECONDS
+    entry = _JwksEntry(
+        expires_at,
+        expires_at - _JWKS_REFRESH_AHEAD_SECONDS,
+        jwks,
+        MappingProxyType(jwks_index),
+        MappingProxyType(public_keys),
+    )
+    _jwks_cache[pool_key] = entry
+    _jwks_cache.move_to_end(pool_key)
+
+    # Evict the least recently used pool once the cache is full
+    while len(_jwks_cache) > _JWKS_CACHE_SIZE:
+        try:
+            _jwks_cache.popitem(last=False)
+        except KeyError:
+            break
+
+    return entry
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert parsed JSON into read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({name: _freeze(item) for name, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _build_public_key(jwk_key: Mapping[str, Any]) -> RSAPublicKey:
+    """Construct an RSA public key from a JWK's base64url-encoded modulus (n) and exponent (e)."""
+    n = int.from_bytes(_b64url_decode(jwk_key["n"]), "big")
+    e = int.from_bytes(_b64url_decode(jwk_key["e"]), "big")
+    return RSAPublicNumbers(e, n).public_key()
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode unpadded base64url data."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _start_background_refresh(pool_key: tuple[str, str]) -> None:
+    """Start a background JWKS refresh unless a fetch for the pool is already in progress."""
+    lock = _get_jwks_lock(pool_key)
+    if not lock.acquire(blocking=False):
+        return
+
+    try:
+        # The background thread releases the lock when the refresh completes
+        threading.Thread(target=_refresh_jwks_in_background, args=(pool_key, lock), daemon=True).start()
+    except Exception:
+        lock.release()
+        raise
+
+
+def _refresh_jwks_in_background(pool_key: tuple[str, str], lock: threading.Lock) -> None:
+    """Refresh a user pool's cached JWKS, keeping the current keys if the fetch fails."""
+    try:
+        _fetch_jwks(pool_key)
+    except Exception as e:
+        logger.warning(f"Background JWKS refresh failed: {e}")
+        # Delay the next refresh attempt instead of retrying on every request
+        cached = _jwks_cache.get(pool_key)
+        if cached is not None:
+            _jwks_cache[pool_key] = cached._replace(refresh_at=time.time() + _JWKS_RETRY_SECONDS)
+    finally:
+        lock.release()
+
+
+def _peek_kid(token: str) -> str:
+    """
+    Extract the key ID (kid) from a JWT header without verifying the token.
+
+    Only the first (header) segment is base64-decoded and parsed. The header must
+    declare RS256, the only algorithm the token is verified with.
+
+    Args:
+        token: Encoded JWT
+
+    Returns:
+        Key ID from the token header
+
+    Raises:
+        ValueError: If the token header is malformed, doesn't declare RS256, or has no kid
+    """
+    header_segment, sep, _ = token.partition(".")
+    if not sep:
+        raise ValueError("Token is not a JWT")
+
+    header = _json.loads(_b64url_decode(header_segment))
+    if not isinstance(header, dict):
+        raise ValueError("Token header is not a JSON object")
+
+    if header.get("alg") != "RS256":
+        raise ValueError(f"Unsupported token algorithm: {header.get('alg')}")
+
+    kid = header.get("kid")
+    if not isinstance(kid, str):
+        raise ValueError("Token header has no kid")
+    return kid
+
+
+def _verify_fast(
+    token: str,
+    public_key: RSAPublicKey,
+    issuer: str,
+    audience: str,
+    now: float,
+) -> dict[str, Any]:
+    """
+    Verify an RS256 JWT signature and its registered claims.
+
+    Calls the cryptography RSA primitive directly and checks only the claims
+    Cognito tokens rely on, instead of going through jwt.decode().
+
+    Args:
+        token: Encoded JWT
+        public_key: RSA public key for the token's kid
+        issuer: Expected iss claim
+        audience: Expected app client ID (aud claim, or client_id for access tokens)
+        now: Current Unix timestamp
+
+    Returns:
+        Decoded JWT claims
+
+    Raises:
+        jwt.InvalidTokenError: If the token is malformed, the signature is invalid,
+            or the exp, nbf, iat, iss, aud or client_id claims don't validate
+    """
+    signing_input, _, signature_segment = token.rpartition(".")
+    header_segment, _, payload_segment = signing_input.partition(".")
+    if not header_segment or not payload_segment or not signature_segment or "." in payload_segment:
+        raise DecodeError("Not enough segments")
+
+    try:
+        signature = _b64url_decode(signature_segment)
+        public_key.verify(signature, signing_input.encode("ascii"), padding.PKCS1v15(), hashes.SHA256())
+    except ValueError as e:
+        raise DecodeError(f"Invalid signature encoding: {e}")
+    except InvalidSignature:
+        raise InvalidSignatureError("Signature verification failed")
+
+    try:
+        claims = _json.loads(_b64url_decode(payload_segment))
+    except ValueError as e:
+        raise DecodeError(f"Invalid payload encoding: {e}")
+
+    if not isinstance(claims, dict):
+        raise DecodeError("Invalid payload: expected a JSON object")
+
+    exp = claims.get("exp")
+    if not isinstance(exp, int | float):
+        raise MissingRequiredClaimError("exp")
+    if exp <= now:
+        raise ExpiredSignatureError("Signature has expired")
+
+    nbf = claims.get("nbf")
+    if isinstance(nbf, int | float) and nbf > now:
+        raise ImmatureSignatureError("The token is not yet valid (nbf)")
+
+    iat = claims.get("iat")
+    if isinstance(iat, int | float) and iat > now:
+        raise ImmatureSignatureError("The token is not yet valid (iat)")
+
+    if claims.get("iss") != issuer:
+        raise InvalidIssuerError("Invalid issuer")
+
+    # Cognito access tokens carry the app client ID in client_id and have no aud claim
+    if claims.get("token_use") == "access":
+        if claims.get("client_id") != audience:
+            raise InvalidAudienceError("Client ID doesn't match")
+        return claims
+
+    token_audience = claims.get("aud")
+    if token_audience is None:
+        raise MissingRequiredClaimError("aud")
+    if token_audience != audience and not (isinstance(token_audience, list) and audience in token_audience):
+        raise InvalidAudienceError("Audience doesn't match")
+
+    return claims
 
 
 def validate_jwt_token(
@@ -71,21 +478,23 @@ def validate_jwt_token(
     Raises:
         UnauthorizedError: If token is missing, invalid, or expired
     """
-    # Get Authorization header
-    headers = event.get("headers", {})
-    auth_header = headers.get("authorization") or headers.get("Authorization")
+    # Get Authorization header (API Gateway v2 lowercases header names; v1 preserves the client's casing)
+    headers = event.get("headers") or {}
+    auth_header = headers.get("authorization")
+    if auth_header is None:
+        auth_header = next((value for name, value in headers.items() if name.lower() == "authorization"), None)
 
     if not auth_header:
         logger.warning("Missing Authorization header")
         raise UnauthorizedError("Missing Authorization header")
 
     # Extract token from "Bearer <token>"
-    parts = auth_header.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
+    match = _BEARER_RE.fullmatch(auth_header)
+    if not match:
         logger.warning("Invalid Authorization header format")
         raise UnauthorizedError("Invalid Authorization header format")
 
-    token = parts[1]
+    token = match.group(1)
 
     # Get configuration from environment or parameters
     cognito_region = region or os.environ.get("COGNITO_REGION", "us-west-2")
@@ -97,41 +506,55 @@ def validate_jwt_token(
     if not cognito_app_client_id:
         raise ValueError("COGNITO_APP_CLIENT_ID environment variable or app_client_id parameter is required")
 
-    try:
-        # Get JWKS
-        jwks = get_jwks(region=cognito_region, user_pool_id=cognito_user_pool_id)
+    issuer = _get_issuer(cognito_region, cognito_user_pool_id)
 
-        # Decode token header to get key ID
-        unverified_header = jwt.get_unverified_header(token)
-        kid = unverified_header.get("kid")
+    # Serve previously verified tokens from cache until they expire
+    token_cache_key = (hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest(), issuer, cognito_app_client_id)
+    cached = _verified_token_cache.get(token_cache_key)
+    if cached is not None:
+        exp, cached_claims = cached
+        if exp > time.time():
+            try:
+                _verified_token_cache.move_to_end(token_cache_key)
+            except KeyError:
+                # Evicted by another thread since the lookup; the claims are still valid
+                pass
+            return copy.deepcopy(cached_claims)
+        _verified_token_cache.pop(token_cache_key, None)
 
-        # Find the matching key
-        key = None
-        for jwk_key in jwks["keys"]:
-            if jwk_key["kid"] == kid:
-                key = jwk_key
-                break
+    try:
+        # Read the key ID from the token header without decoding the rest of the token
+        try:
+            kid = _peek_kid(token)
+        except ValueError as e:
+            logger.warning(f"Malformed token header: {e}")
+            raise UnauthorizedError("Invalid token")
 
-        if not key:
+        # Find the matching RSA key, constructed when the JWKS was fetched
+        try:
+            key = get_signing_key(kid, region=cognito_region, user_pool_id=cognito_user_pool_id)
+        except KeyError:
             logger.warning(f"Public key not found for kid: {kid}")
             raise UnauthorizedError("Invalid token")
 
         # Verify and decode the token
-        claims_result: dict[str, Any] = jwt.decode(
-            token,
-            key,
-            algorithms=["RS256"],
-            audience=cognito_app_client_id,
-            issuer=f"https://cognito-idp.{cognito_region}.amazonaws.com/{cognito_user_pool_id}",
-        )
+        claims_result = _verify_fast(token, key, issuer, cognito_app_client_id, time.time())
 
         logger.info(f"Token validated for user: {claims_result.get('cognito:username')}")
+
+        # Only tokens with an expiry are cached, so an entry can never outlive its token
+        expires_at = claims_result.get("exp")
+        if isinstance(expires_at, int | float):
+            _verified_token_cache[token_cache_key] = (float(expires_at), copy.deepcopy(claims_result))
+            if len(_verified_token_cache) > _VERIFIED_TOKEN_CACHE_SIZE:
+                _verified_token_cache.popitem(last=False)
+
         return claims_result
 
     except UnauthorizedError:
         # Re-raise UnauthorizedError without modification
         raise
-    except JWTError as e:
+    except InvalidTokenError as e:
         logger.warning(f"JWT validation failed: {e}")
         raise UnauthorizedError("Invalid or expired token")
     except Exception as e:
@@ -3,8 +3,10 @@
 from jscom_common.dynamodb.helpers import (
     decode_pagination_token,
     dynamodb_to_pydantic,
+    dynamodb_to_pydantic_many,
     encode_pagination_token,
     pydantic_to_dynamodb,
+    pydantic_to_dynamodb_many,
 )
 
 __all__ = [
@@ -12,4 +14,6 @@ __all__ = [
     "decode_pagination_token",
     "pydantic_to_dynamodb",
     "dynamodb_to_pydantic",
+    "pydantic_to_dynamodb_many",
+    "dynamodb_to_pydantic_many",
 ]
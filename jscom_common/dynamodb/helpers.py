@@ -5,7 +5,7 @@ Provides utilities for pagination token encoding/decoding and Pydantic model con
 for working with DynamoDB items.
 
 Module Organization Note:
-    This module currently combines pagination and Pydantic utilities (~120 lines).
+    This module currently combines pagination and Pydantic utilities (~270 lines).
     Consider splitting into separate modules when file exceeds ~300 lines:
     - dynamodb/pagination.py (encode/decode tokens, query helpers)
     - dynamodb/pydantic.py (model conversion utilities)
@@ -14,41 +14,53 @@ Module Organization Note:
 """
 
 import base64
-import json
-from typing import Any, TypeVar
+from collections.abc import Callable, Sequence
+from decimal import Decimal
+from functools import lru_cache
+from types import NoneType, UnionType
+from typing import Any, TypeVar, Union, get_args, get_origin
 
-from pydantic import BaseModel
+import msgpack
+from pydantic import BaseModel, PlainSerializer, TypeAdapter, WrapSerializer
+
+from jscom_common import _json
 
 T = TypeVar("T", bound=BaseModel)
 
 
 def encode_pagination_token(last_key: dict[str, Any]) -> str:
     """
-    Encode DynamoDB LastEvaluatedKey as base64 pagination token.
+    Encode DynamoDB LastEvaluatedKey as a URL-safe pagination token.
+
+    The key is packed with msgpack and encoded as unpadded URL-safe base64, so the
+    token is compact and can be returned as a query-string cursor without quoting.
 
     Args:
         last_key: LastEvaluatedKey dictionary from DynamoDB query or scan response
 
     Returns:
-        Base64-encoded token string
+        URL-safe base64-encoded token string (no padding)
 
     Examples:
         >>> last_key = {"id": "123", "timestamp": 1234567890}
         >>> token = encode_pagination_token(last_key)
         >>> print(token)
-        'eyJpZCI6ICIxMjMiLCAidGltZXN0YW1wIjogMTIzNDU2Nzg5MH0='
+        'gqJpZKMxMjOpdGltZXN0YW1wzkmWAtI'
     """
-    json_str = json.dumps(last_key)
-    encoded = base64.b64encode(json_str.encode("utf-8"))
-    return encoded.decode("utf-8")
+    packed = msgpack.packb(last_key, use_bin_type=True)
+    return base64.urlsafe_b64encode(packed).rstrip(b"=").decode("ascii")
 
 
 def decode_pagination_token(token: str) -> dict[str, Any]:
     """
-    Decode base64 pagination token to DynamoDB ExclusiveStartKey.
+    Decode pagination token to DynamoDB ExclusiveStartKey.
+
+    Accepts tokens produced by encode_pagination_token() as well as legacy
+    base64-encoded JSON tokens issued by earlier releases. Both the standard and
+    URL-safe base64 alphabets are accepted, with or without padding.
 
     Args:
-        token: Base64-encoded pagination token from previous response
+        token: Pagination token from previous response
 
     Returns:
         DynamoDB ExclusiveStartKey dictionary
@@ -57,25 +69,38 @@ def decode_pagination_token(token: str) -> dict[str, Any]:
         ValueError: If token is invalid or malformed
 
     Examples:
-        >>> token = "eyJpZCI6ICIxMjMifQ=="
+        >>> token = "gaJpZKMxMjM"
         >>> start_key = decode_pagination_token(token)
         >>> print(start_key)
         {'id': '123'}
     """
     try:
-        decoded = base64.b64decode(token.encode("utf-8"))
-        result: dict[str, Any] = json.loads(decoded.decode("utf-8"))
-        return result
+        data = token.encode("ascii")
+        decoded = base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
     except Exception as e:
         raise ValueError(f"Invalid pagination token: {e}")
 
+    try:
+        result = msgpack.unpackb(decoded, raw=False)
+    except Exception:
+        # Legacy tokens are base64-encoded JSON; a JSON document never unpacks as a single msgpack object
+        try:
+            result = _json.loads(decoded)
+        except Exception as e:
+            raise ValueError(f"Invalid pagination token: {e}")
+
+    if not isinstance(result, dict):
+        raise ValueError("Invalid pagination token: expected an encoded dictionary")
+    return result
+
 
 def pydantic_to_dynamodb(model: BaseModel) -> dict[str, Any]:
     """
     Convert Pydantic model to DynamoDB item dictionary.
 
     Removes None values which DynamoDB doesn't support, and converts the model
-    to a dictionary using Pydantic's model_dump().
+    to a dictionary using Pydantic's model_dump(). Models whose fields are all
+    scalar types skip the serializer and are read straight from the instance.
 
     Args:
         model: Pydantic model instance
@@ -94,6 +119,9 @@ def pydantic_to_dynamodb(model: BaseModel) -> dict[str, Any]:
         >>> print(item)
         {'id': '123', 'name': 'John'}
     """
+    dump = _get_fast_dumper(type(model))
+    if dump is not None:
+        return dump(model)
     return model.model_dump(exclude_none=True)
 
 
@@ -127,3 +155,117 @@ def dynamodb_to_pydantic(item: dict[str, Any], model_class: type[T]) -> T:
         'John'
     """
     return model_class.model_validate(item)
+
+
+def pydantic_to_dynamodb_many(models: Sequence[BaseModel]) -> list[dict[str, Any]]:
+    """
+    Convert a batch of Pydantic models to DynamoDB item dictionaries.
+
+    Equivalent to calling pydantic_to_dynamodb() on each model, but resolves the
+    dump method once for the class of the first model. Models of any other class,
+    such as subclasses, are dumped through their own class.
+
+    Args:
+        models: Pydantic model instances, typically of the same class
+
+    Returns:
+        List of DynamoDB-compatible dictionaries with None values excluded
+
+    Examples:
+        >>> users = [User(id="1", name="John"), User(id="2", name="Jane", email=None)]
+        >>> items = pydantic_to_dynamodb_many(users)
+        >>> print(items)
+        [{'id': '1', 'name': 'John'}, {'id': '2', 'name': 'Jane'}]
+    """
+    if not models:
+        return []
+
+    model_class = type(models[0])
+    fast_dump = _get_fast_dumper(model_class)
+    if fast_dump is None:
+        return [model.model_dump(exclude_none=True) for model in models]
+
+    return [fast_dump(model) if type(model) is model_class else pydantic_to_dynamodb(model) for model in models]
+
+
+def dynamodb_to_pydantic_many(items: Sequence[dict[str, Any]], model_class: type[T]) -> list[T]:
+    """
+    Convert a batch of DynamoDB items to Pydantic model instances.
+
+    Validates the whole batch in a single pydantic-core call using a cached
+    TypeAdapter for list[model_class], instead of validating item by item.
+
+    Args:
+        items: DynamoDB item dictionaries (from boto3 resource API)
+        model_class: Pydantic model class to instantiate
+
+    Returns:
+        List of validated Pydantic model instances
+
+    Raises:
+        ValidationError: If any item doesn't match model schema
+
+    Examples:
+        >>> response = table.query(KeyConditionExpression=Key("pk").eq("USER"))
+        >>> users = dynamodb_to_pydantic_many(response["Items"], User)
+        >>> print(users[0].name)
+        'John'
+    """
+    result: list[T] = _list_adapter(model_class).validate_python(items)
+    return result
+
+
+@lru_cache(maxsize=128)
+def _list_adapter(model_class: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Build and cache the list TypeAdapter for a model class."""
+    return TypeAdapter(list[model_class])  # type: ignore[valid-type]
+
+
+# Field types that model_dump() returns unchanged in python mode
+_SCALAR_TYPES: frozenset[Any] = frozenset({str, int, float, bool, bytes, Decimal, NoneType})
+
+
+@lru_cache(maxsize=256)
+def _get_fast_dumper(model_class: type[BaseModel]) -> Callable[[BaseModel], dict[str, Any]] | None:
+    """
+    Return a dump function equivalent to model_dump(exclude_none=True) for flat models.
+
+    Returns None when the model needs Pydantic's serializer: nested or non-scalar
+    fields, computed or excluded fields, extra fields, aliases, custom serializers
+    (decorators or Annotated metadata), RootModel subclasses, or an overridden
+    model_dump().
+    """
+    decorators = model_class.__pydantic_decorators__
+    config = model_class.model_config
+    if (
+        model_class.model_dump is not BaseModel.model_dump
+        or model_class.__pydantic_root_model__
+        or model_class.model_computed_fields
+        or config.get("extra") == "allow"
+        or config.get("serialize_by_alias")
+        or decorators.field_serializers
+        or decorators.model_serializers
+    ):
+        return None
+
+    for field_info in model_class.model_fields.values():
+        if (
+            field_info.exclude
+            or field_info.alias is not None
+            or field_info.serialization_alias is not None
+            or any(isinstance(meta, PlainSerializer | WrapSerializer) for meta in field_info.metadata)
+            or not _is_scalar_annotation(field_info.annotation)
+        ):
+            return None
+
+    def dump(model: BaseModel) -> dict[str, Any]:
+        return {name: value for name, value in model.__dict__.items() if value is not None}
+
+    return dump
+
+
+def _is_scalar_annotation(annotation: Any) -> bool:
+    """Check whether an annotation is a scalar type or a union of scalar types."""
+    if get_origin(annotation) in (Union, UnionType):
+        return all(arg in _SCALAR_TYPES for arg in get_args(annotation))
+    return annotation in _SCALAR_TYPES
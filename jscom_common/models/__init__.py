@@ -1,5 +1,5 @@
 """Shared data models for JSCOM services."""
 
-from jscom_common.models.api_response import ApiResponse, PaginatedResponse
+from jscom_common.models.api_response import ApiResponse, PaginatedResponse, error_response_bytes
 
-__all__ = ["ApiResponse", "PaginatedResponse"]
+__all__ = ["ApiResponse", "PaginatedResponse", "error_response_bytes"]
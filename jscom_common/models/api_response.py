@@ -5,9 +5,10 @@ These models provide consistent structure for API responses across all JSCOM pro
 supporting both status-code-based and success-boolean-based patterns.
 """
 
-from typing import Generic, TypeVar
+from http import HTTPStatus
+from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 T = TypeVar("T")
 
@@ -36,8 +37,16 @@ class ApiResponse(BaseModel, Generic[T]):
 
         # Error response
         response = ApiResponse[None](status=404, error="User not found")
+
+    Each parameterization (e.g. ApiResponse[User]) builds its validation schema
+    when first created. Services should bind it at module import so the build
+    happens during cold start rather than on the first request:
+
+        UserResponse = ApiResponse[User]
     """
 
+    model_config = ConfigDict(defer_build=False, frozen=False, extra="ignore")
+
     status: int | None = Field(default=None, description="HTTP status code")
     success: bool | None = Field(default=None, description="Whether the operation was successful")
     data: T | None = Field(default=None, description="Response data")
@@ -54,14 +63,14 @@ class PaginatedResponse(BaseModel, Generic[T]):
     Attributes:
         items: List of items in the current page
         count: Number of items in current response
-        next_token: Base64-encoded pagination token for next page (null if no more pages)
+        next_token: Pagination token for next page (null if no more pages)
 
     Examples:
         # Return paginated list of users
         response = PaginatedResponse[User](
             items=[user1, user2],
             count=2,
-            next_token="eyJpZCI6IjEyMyJ9"
+            next_token="gaJpZKMxMjM"
         )
 
         # Last page (no more items)
@@ -72,6 +81,54 @@ class PaginatedResponse(BaseModel, Generic[T]):
         )
     """
 
+    model_config = ConfigDict(defer_build=False, frozen=False, extra="ignore")
+
     items: list[T] = Field(description="List of items")
     count: int = Field(description="Number of items in this page")
     next_token: str | None = Field(default=None, description="Token for next page (if available)")
+
+
+# Common parameterizations built at import time. Pydantic only caches generic
+# parameterizations weakly, so these references keep the built schemas alive.
+_PREBUILT_MODELS: tuple[type[BaseModel], ...] = (
+    ApiResponse[dict[str, Any]],
+    ApiResponse[None],
+    PaginatedResponse[dict[str, Any]],
+)
+
+
+# Error envelopes for every 4xx/5xx status, serialized once at import
+_ERROR_RESPONSE_BYTES: dict[int, bytes] = {
+    http_status.value: ApiResponse[None](status=http_status.value, error=http_status.phrase)
+    .model_dump_json(exclude_none=True)
+    .encode("utf-8")
+    for http_status in HTTPStatus
+    if http_status.value >= 400
+}
+
+
+def error_response_bytes(status: int) -> bytes:
+    """
+    Return a pre-serialized ApiResponse error envelope for an HTTP error status.
+
+    Envelopes for every 4xx and 5xx status are serialized once at import, so the
+    common failure paths can return a response body without building and
+    serializing a model per request.
+
+    Args:
+        status: HTTP error status code (4xx or 5xx)
+
+    Returns:
+        JSON bytes of ApiResponse(status=status, error=<standard reason phrase>)
+
+    Raises:
+        ValueError: If status is not a known 4xx or 5xx HTTP status code
+
+    Examples:
+        >>> error_response_bytes(401)
+        b'{"status":401,"error":"Unauthorized"}'
+    """
+    try:
+        return _ERROR_RESPONSE_BYTES[status]
+    except KeyError:
+        raise ValueError(f"Not a known HTTP error status: {status}")
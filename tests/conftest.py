@@ -8,4 +8,7 @@ def reset_jwks_cache() -> None:
     """Reset the JWKS cache before each test to ensure test isolation."""
     import jscom_common.auth.cognito as cognito_module
 
-    cognito_module._jwks_cache = None
+    cognito_module._jwks_cache.clear()
+    cognito_module._jwks_locks.clear()
+    cognito_module._issuer_cache.clear()
+    cognito_module._verified_token_cache.clear()
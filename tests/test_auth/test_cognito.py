@@ -1,12 +1,38 @@
 """Tests for Cognito JWT validation utilities."""
 
+import base64
+import json
+import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import jwt
 import pytest
 from aws_lambda_powertools.event_handler.exceptions import UnauthorizedError
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt import ExpiredSignatureError
 
-from jscom_common.auth.cognito import get_jwks, validate_jwt_token
+from jscom_common.auth.cognito import (
+    _peek_kid,
+    get_jwks,
+    get_jwks_index,
+    get_signing_key,
+    validate_jwt_token,
+    warmup,
+)
+
+
+@pytest.fixture(scope="module")
+def private_key() -> rsa.RSAPrivateKey:
+    """Generate an RSA key pair for signing test tokens."""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def _rsa_jwk(private_key: rsa.RSAPrivateKey, kid: str) -> dict[str, Any]:
+    """Build the public JWK Cognito would publish for a private key."""
+    jwk_key: dict[str, Any] = jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    jwk_key.update({"kid": kid, "alg": "RS256", "use": "sig"})
+    return jwk_key
 
 
 class TestGetJWKS:
@@ -16,22 +42,150 @@ class TestGetJWKS:
         """Test successful JWKS fetch and caching."""
         mock_jwks = {"keys": [{"kid": "test-key-id", "kty": "RSA", "n": "test-n", "e": "AQAB"}]}
 
-        with patch("jscom_common.auth.cognito.requests.get") as mock_get:
+        with patch("jscom_common.auth.cognito._http.request") as mock_get:
             mock_response = MagicMock()
-            mock_response.json.return_value = mock_jwks
-            mock_response.raise_for_status = MagicMock()
+            mock_response.status = 200
+            mock_response.data = json.dumps(mock_jwks).encode("utf-8")
             mock_get.return_value = mock_response
 
             # First call should fetch from Cognito
             result = get_jwks(region="us-west-2", user_pool_id="test-pool-id")
-            assert result == mock_jwks
+            assert result == {"keys": tuple(mock_jwks["keys"])}
             assert mock_get.call_count == 1
 
             # Second call should use cache
             result2 = get_jwks(region="us-west-2", user_pool_id="test-pool-id")
-            assert result2 == mock_jwks
+            assert result2 == {"keys": tuple(mock_jwks["keys"])}
             assert mock_get.call_count == 1  # Still 1, not 2
 
+            # Cached JWKS is shared, so it is read-only at every level
+            with pytest.raises(TypeError):
+                result["keys"] = []  # type: ignore[index]
+            with pytest.raises(TypeError):
+                result["keys"][0]["kid"] = "forged"
+            with pytest.raises(AttributeError):
+                result["keys"].append({"kid": "forged"})
+            index = get_jwks_index(region="us-west-2", user_pool_id="test-pool-id")
+            with pytest.raises(TypeError):
+                index["test-key-id"]["n"] = "forged"  # type: ignore[index]
+
+    def test_get_jwks_http_error(self) -> None:
+        """Test that a non-200 JWKS response raises and is not cached."""
+        from urllib3.exceptions import HTTPError
+
+        with patch("jscom_common.auth.cognito._http.request") as mock_get:
+            mock_response = MagicMock()
+            mock_response.status = 503
+            mock_get.return_value = mock_response
+
+            with pytest.raises(HTTPError, match="503"):
+                get_jwks(region="us-west-2", user_pool_id="test-pool-id")
+
+            with pytest.raises(HTTPError):
+                get_jwks(region="us-west-2", user_pool_id="test-pool-id")
+            assert mock_get.call_count == 2
+
+    def test_get_jwks_refetches_after_ttl(self) -> None:
+        """Test that an expired JWKS cache entry is refetched."""
+        import jscom_common.auth.cognito as cognito_module
+
+        old_jwks = {"keys": [{"kid": "old-key"}]}
+        new_jwks = {"keys": [{"kid": "new-key"}]}
+        expires_at = time.time() - 1
+        cognito_module._jwks_cache[("us-west-2", "test-pool-id")] = cognito_module._JwksEntry(
+            expires_at, expires_at, old_jwks, {"old-key": old_jwks["keys"][0]}, {}
+        )
+
+        with patch("jscom_common.auth.cognito._http.request") as mock_get:
+            mock_response = MagicMock()
+            mock_response.status = 200
+            mock_response.data = json.dumps(new_jwks).encode("utf-8")
+            mock_get.return_value = mock_response
+
+            assert get_jwks(region="us-west-2", user_pool_id="test-pool-id") == {"keys": tuple(new_jwks["keys"])}
+            assert get_jwks_index(region="us-west-2", user_pool_id="test-pool-id") == {"new-key": {"kid": "new-key"}}
+            assert mock_get.call_count == 1
+
+    def test_get_jwks_serves_stale_on_refresh_failure(self) -> None:
+        """Test that stale keys are served when a refresh fails, and the retry is delayed."""
+        import jscom_common.auth.cognito as cognito_module
+
+        stale_jwks = {"keys": [{"kid": "stale-key"}]}
+        expires_at = time.time() - 1
+        cognito_module._jwks_cache[("us-west-2", "test-pool-id")] = cognito_module._JwksEntry(
+            expires_at, expires_at, stale_jwks, {"stale-key": stale_jwks["keys"][0]}, {}
+        )
+
+        with patch("jscom_common.auth.cognito._http.request") as mock_get:
+            mock_response = MagicMock()
+            mock_response.status = 500
+            mock_get.return_value = mock_response
+
+            assert get_jwks(region="us-west-2", user_pool_id="test-pool-id") == stale_jwks
+            assert get_jwks(region="us-west-2", user_pool_id="test-pool-id") == stale_jwks
+            assert mock_get.call_count == 1
+
+    def test_get_jwks_refresh_ahead(self) -> None:
+        """Test that a JWKS close to expiry is served while being refreshed in the background."""
+        import jscom_common.auth.cognito as cognito_module
+
+        old_jwks = {"keys": [{"kid": "old-key"}]}
+        new_jwks = {"keys": [{"kid": "new-key"}]}
+        cognito_module._jwks_cache[("us-west-2", "test-pool-id")] = cognito_module._JwksEntry(
+            time.time() + 60, time.time() - 1, old_jwks, {"old-key": old_jwks["keys"][0]}, {}
+        )
+
+        with (
+            patch("jscom_common.auth.cognito._http.request") as mock_get,
+            patch("jscom_common.auth.cognito.threading.Thread") as mock_thread,
+        ):
+            mock_response = MagicMock()
+            mock_response.status = 200
+            mock_response.data = json.dumps(new_jwks).encode("utf-8")
+            mock_get.return_value = mock_response
+
+            # Run the background refresh synchronously when the thread is started
+            mock_thread.side_effect = lambda target, args, daemon: MagicMock(start=lambda: target(*args))
+
+            # Current keys are served immediately
+            assert get_jwks(region="us-west-2", user_pool_id="test-pool-id") == old_jwks
+            mock_thread.assert_called_once()
+
+            # Refreshed keys are served afterwards and the fetch lock was released
+            assert get_jwks(region="us-west-2", user_pool_id="test-pool-id") == {"keys": tuple(new_jwks["keys"])}
+            assert not cognito_module._jwks_locks[("us-west-2", "test-pool-id")].locked()
+            assert mock_get.call_count == 1
+
+    def test_get_jwks_cached_per_user_pool(self) -> None:
+        """Test that each user pool keeps its own JWKS and the cache is a bounded LRU."""
+        import jscom_common.auth.cognito as cognito_module
+
+        def _respond(method: str, url: str, **kwargs: Any) -> MagicMock:
+            mock_response = MagicMock()
+            mock_response.status = 200
+            mock_response.data = json.dumps({"keys": [{"kid": url.split("/")[3]}]}).encode("utf-8")
+            return mock_response
+
+        with (
+            patch("jscom_common.auth.cognito._http.request", side_effect=_respond) as mock_get,
+            patch.object(cognito_module, "_JWKS_CACHE_SIZE", 2),
+        ):
+            assert get_jwks(region="us-west-2", user_pool_id="pool-a") == {"keys": ({"kid": "pool-a"},)}
+            assert get_jwks(region="us-west-2", user_pool_id="pool-b") == {"keys": ({"kid": "pool-b"},)}
+            assert get_jwks(region="us-west-2", user_pool_id="pool-a") == {"keys": ({"kid": "pool-a"},)}
+            assert mock_get.call_count == 2
+
+            # A third pool evicts the least recently used entry; pool-a was just read
+            get_jwks(region="us-west-2", user_pool_id="pool-c")
+            assert list(cognito_module._jwks_cache) == [("us-west-2", "pool-a"), ("us-west-2", "pool-c")]
+
+            # Refetching an expired pool also counts as a use
+            pool_a = ("us-west-2", "pool-a")
+            cognito_module._jwks_cache[pool_a] = cognito_module._jwks_cache[pool_a]._replace(expires_at=0.0)
+            get_jwks(region="us-west-2", user_pool_id="pool-a")
+            assert list(cognito_module._jwks_cache) == [("us-west-2", "pool-c"), pool_a]
+            assert mock_get.call_count == 4
+
     def test_get_jwks_missing_user_pool_id(self) -> None:
         """Test that missing user pool ID raises ValueError."""
         with pytest.raises(ValueError, match="COGNITO_USER_POOL_ID"):
@@ -42,14 +196,131 @@ class TestGetJWKS:
         """Test JWKS fetch using environment variables."""
         mock_jwks = {"keys": [{"kid": "test-key"}]}
 
-        with patch("jscom_common.auth.cognito.requests.get") as mock_get:
+        with patch("jscom_common.auth.cognito._http.request") as mock_get:
             mock_response = MagicMock()
-            mock_response.json.return_value = mock_jwks
-            mock_response.raise_for_status = MagicMock()
+            mock_response.status = 200
+            mock_response.data = json.dumps(mock_jwks).encode("utf-8")
             mock_get.return_value = mock_response
 
             result = get_jwks()
-            assert result == mock_jwks
+            assert result == {"keys": tuple(mock_jwks["keys"])}
+
+
+class TestGetJWKSIndex:
+    """Tests for get_jwks_index function."""
+
+    def test_get_jwks_index_by_kid(self) -> None:
+        """Test that JWKS keys are indexed by key ID and fetched once."""
+        key_a = {"kid": "key-a", "kty": "RSA"}
+        key_b = {"kid": "key-b", "kty": "RSA"}
+        mock_jwks = {"keys": [key_a, key_b]}
+
+        with patch("jscom_common.auth.cognito._http.request") as mock_get:
+            mock_response = MagicMock()
+            mock_response.status = 200
+            mock_response.data = json.dumps(mock_jwks).encode("utf-8")
+            mock_get.return_value = mock_response
+
+            index = get_jwks_index(region="us-west-2", user_pool_id="test-pool-id")
+            assert index == {"key-a": key_a, "key-b": key_b}
+
+            # Index is served from cache alongside the JWKS
+            assert get_jwks_index(region="us-west-2", user_pool_id="test-pool-id") is index
+            assert mock_get.call_count == 1
+
+
+class TestGetSigningKey:
+    """Tests for get_signing_key function."""
+
+    def test_get_signing_key_built_at_fetch(self, private_key: rsa.RSAPrivateKey) -> None:
+        """Test that RSA keys are constructed once per fetch and unusable keys are skipped."""
+        mock_jwks = {
+            "keys": [
+                _rsa_jwk(private_key, "key-a"),
+                {"kid": "key-ec", "kty": "EC", "crv": "P-256", "x": "x", "y": "y"},
+                {"kid": "key-bad", "kty": "RSA", "n": "AQ", "e": "AQAB"},
+            ]
+        }
+
+        with patch("jscom_common.auth.cognito._http.request") as mock_get:
+            mock_response = MagicMock()
+            mock_response.status = 200
+            mock_response.data = json.dumps(mock_jwks).encode("utf-8")
+            mock_get.return_value = mock_response
+
+            key = get_signing_key("key-a", region="us-west-2", user_pool_id="test-pool")
+            assert key.public_numbers() == private_key.public_key().public_numbers()
+            assert get_signing_key("key-a", region="us-west-2", user_pool_id="test-pool") is key
+
+            for kid in ["key-ec", "key-bad", "unknown"]:
+                with pytest.raises(KeyError):
+                    get_signing_key(kid, region="us-west-2", user_pool_id="test-pool")
+
+            assert mock_get.call_count == 1
+
+
+class TestWarmup:
+    """Tests for warmup function."""
+
+    def test_warmup_primes_caches(self, private_key: rsa.RSAPrivateKey) -> None:
+        """Test that warmup fetches the JWKS and builds every signing key once."""
+        import jscom_common.auth.cognito as cognito_module
+
+        mock_jwks = {"keys": [_rsa_jwk(private_key, "key-a"), _rsa_jwk(private_key, "key-b")]}
+
+        with patch("jscom_common.auth.cognito._http.request") as mock_get:
+            mock_response = MagicMock()
+            mock_response.status = 200
+            mock_response.data = json.dumps(mock_jwks).encode("utf-8")
+            mock_get.return_value = mock_response
+
+            warmup(region="us-west-2", user_pool_id="test-pool")
+            warmup(region="us-west-2", user_pool_id="test-pool")
+
+            assert mock_get.call_count == 1
+
+        assert set(cognito_module._jwks_cache[("us-west-2", "test-pool")].public_keys) == {"key-a", "key-b"}
+        assert cognito_module._issuer_cache[("us-west-2", "test-pool")] == (
+            "https://cognito-idp.us-west-2.amazonaws.com/test-pool"
+        )
+
+    def test_warmup_missing_user_pool_id(self) -> None:
+        """Test that missing user pool ID raises ValueError."""
+        with pytest.raises(ValueError, match="COGNITO_USER_POOL_ID"):
+            warmup(region="us-west-2", user_pool_id=None)
+
+
+class TestPeekKid:
+    """Tests for _peek_kid function."""
+
+    @staticmethod
+    def _segment(data: Any) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode("utf-8")).rstrip(b"=").decode("ascii")
+
+    def test_peek_kid(self) -> None:
+        """Test reading the kid from an unpadded header segment."""
+        token = f"{self._segment({'alg': 'RS256', 'kid': 'test-kid'})}.{self._segment({'sub': '123'})}.signature"
+
+        assert _peek_kid(token) == "test-kid"
+
+    def test_peek_kid_missing_kid(self) -> None:
+        """Test that a header without kid raises ValueError."""
+        token = f"{self._segment({'alg': 'RS256'})}.payload.signature"
+
+        with pytest.raises(ValueError, match="no kid"):
+            _peek_kid(token)
+
+    def test_peek_kid_rejects_other_algorithms(self) -> None:
+        """Test that headers declaring anything other than RS256 raise ValueError."""
+        for header in [{"alg": "none", "kid": "test-kid"}, {"alg": "HS256", "kid": "test-kid"}, {"kid": "test-kid"}]:
+            with pytest.raises(ValueError, match="Unsupported token algorithm"):
+                _peek_kid(f"{self._segment(header)}.payload.signature")
+
+    def test_peek_kid_malformed(self) -> None:
+        """Test that malformed tokens raise ValueError."""
+        for token in ["no-dots-here", "!!!.payload.signature", f"{self._segment([1, 2])}.payload.signature"]:
+            with pytest.raises(ValueError):
+                _peek_kid(token)
 
 
 class TestValidateJWTToken:
@@ -76,73 +347,189 @@ class TestValidateJWTToken:
         with pytest.raises(UnauthorizedError, match="Invalid Authorization header format"):
             validate_jwt_token(event)
 
-    @patch("jscom_common.auth.cognito.get_jwks")
-    @patch("jscom_common.auth.cognito.jwt.get_unverified_header")
-    @patch("jscom_common.auth.cognito.jwt.decode")
+        # Trailing space with no token
+        event = {"headers": {"Authorization": "Bearer "}}
+
+        with pytest.raises(UnauthorizedError, match="Invalid Authorization header format"):
+            validate_jwt_token(event)
+
+        # Extra segments after the token
+        event = {"headers": {"Authorization": "Bearer token123 extra"}}
+
+        with pytest.raises(UnauthorizedError, match="Invalid Authorization header format"):
+            validate_jwt_token(event)
+
+        # Wrong scheme
+        event = {"headers": {"Authorization": "Basic dXNlcjpwYXNz"}}
+
+        with pytest.raises(UnauthorizedError, match="Invalid Authorization header format"):
+            validate_jwt_token(event)
+
+        # Characters outside the JWT alphabet
+        event = {"headers": {"Authorization": "Bearer abc$def"}}
+
+        with pytest.raises(UnauthorizedError, match="Invalid Authorization header format"):
+            validate_jwt_token(event)
+
+    @patch("jscom_common.auth.cognito._peek_kid")
+    def test_bearer_scheme_case_insensitive(self, mock_peek_kid: MagicMock) -> None:
+        """Test that the Bearer scheme is matched case-insensitively and surrounding whitespace is tolerated."""
+        mock_peek_kid.side_effect = ValueError("stop after header parsing")
+
+        for header in ["Bearer a.b.c", "bearer a.b.c", "BEARER  a.b.c ", "Bearer\ta.b.c"]:
+            event = {"headers": {"Authorization": header}}
+
+            with pytest.raises(UnauthorizedError, match="Invalid token"):
+                validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
+
+            assert mock_peek_kid.call_args.args[0] == "a.b.c"
+
+    @patch("jscom_common.auth.cognito.get_signing_key")
+    @patch("jscom_common.auth.cognito._peek_kid")
+    @patch("jscom_common.auth.cognito._verify_fast")
     def test_successful_token_validation(
         self,
-        mock_decode: MagicMock,
-        mock_get_header: MagicMock,
-        mock_get_jwks: MagicMock,
+        mock_verify: MagicMock,
+        mock_peek_kid: MagicMock,
+        mock_get_signing_key: MagicMock,
     ) -> None:
         """Test successful JWT token validation."""
         event = {"headers": {"Authorization": "Bearer valid-token-123"}}
 
-        mock_jwks = {"keys": [{"kid": "test-kid", "kty": "RSA", "n": "test-n", "e": "AQAB"}]}
-        mock_get_jwks.return_value = mock_jwks
-
-        mock_get_header.return_value = {"kid": "test-kid"}
+        mock_peek_kid.return_value = "test-kid"
 
         mock_claims = {"cognito:username": "testuser", "sub": "user-123", "email": "test@example.com"}
-        mock_decode.return_value = mock_claims
+        mock_verify.return_value = mock_claims
 
         result = validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
 
         assert result == mock_claims
-        mock_decode.assert_called_once()
+        mock_verify.assert_called_once()
+        token, key, issuer, audience, _ = mock_verify.call_args.args
+        assert token == "valid-token-123"
+        assert key is mock_get_signing_key.return_value
+        assert issuer == "https://cognito-idp.us-west-2.amazonaws.com/test-pool"
+        assert audience == "test-client"
+
+    @patch("jscom_common.auth.cognito.get_signing_key")
+    @patch("jscom_common.auth.cognito._peek_kid")
+    @patch("jscom_common.auth.cognito._verify_fast")
+    def test_verified_token_served_from_cache(
+        self,
+        mock_verify: MagicMock,
+        mock_peek_kid: MagicMock,
+        mock_get_signing_key: MagicMock,
+    ) -> None:
+        """Test that a replayed token skips signature verification until it expires."""
+        event = {"headers": {"Authorization": "Bearer valid-token-123"}}
+
+        mock_peek_kid.return_value = "test-kid"
+        mock_claims = {"cognito:username": "testuser", "exp": time.time() + 3600}
+        mock_verify.return_value = mock_claims
+
+        first = validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
+        second = validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
+
+        assert first == mock_claims
+        assert second == mock_claims
+        assert mock_verify.call_count == 1
+
+        # A different audience must not be served from the same cache entry
+        validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="other-client")
+        assert mock_verify.call_count == 2
+
+    @patch("jscom_common.auth.cognito.get_signing_key")
+    @patch("jscom_common.auth.cognito._peek_kid")
+    @patch("jscom_common.auth.cognito._verify_fast")
+    def test_cached_claims_isolated_from_callers(
+        self,
+        mock_verify: MagicMock,
+        mock_peek_kid: MagicMock,
+        mock_get_signing_key: MagicMock,
+    ) -> None:
+        """Test that mutating returned claims, including list values, doesn't affect later cache hits."""
+        event = {"headers": {"Authorization": "Bearer valid-token-123"}}
+
+        mock_peek_kid.return_value = "test-kid"
+        mock_verify.return_value = {"cognito:groups": ["admin"], "exp": time.time() + 3600}
+
+        first = validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
+        first["cognito:groups"].append("injected")
+
+        second = validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
+        second["cognito:groups"].append("injected")
+
+        third = validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
+        assert third["cognito:groups"] == ["admin"]
+        assert mock_verify.call_count == 1
+
+    @patch("jscom_common.auth.cognito.get_signing_key")
+    @patch("jscom_common.auth.cognito._peek_kid")
+    @patch("jscom_common.auth.cognito._verify_fast")
+    def test_expired_cached_token_is_reverified(
+        self,
+        mock_verify: MagicMock,
+        mock_peek_kid: MagicMock,
+        mock_get_signing_key: MagicMock,
+    ) -> None:
+        """Test that cached entries past their exp claim are evicted and re-verified."""
+
+        event = {"headers": {"Authorization": "Bearer valid-token-123"}}
+
+        mock_peek_kid.return_value = "test-kid"
+        mock_verify.return_value = {"cognito:username": "testuser", "exp": time.time() - 1}
+
+        validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
+
+        mock_verify.side_effect = ExpiredSignatureError("Signature has expired")
+        with pytest.raises(UnauthorizedError, match="Invalid or expired token"):
+            validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
+        assert mock_verify.call_count == 2
 
-    @patch("jscom_common.auth.cognito.get_jwks")
-    @patch("jscom_common.auth.cognito.jwt.get_unverified_header")
+    @patch("jscom_common.auth.cognito.get_signing_key")
+    @patch("jscom_common.auth.cognito._peek_kid")
     def test_kid_not_found_in_jwks(
         self,
-        mock_get_header: MagicMock,
-        mock_get_jwks: MagicMock,
+        mock_peek_kid: MagicMock,
+        mock_get_signing_key: MagicMock,
     ) -> None:
         """Test that missing key ID in JWKS raises UnauthorizedError."""
         event = {"headers": {"Authorization": "Bearer token123"}}
 
-        mock_jwks = {"keys": [{"kid": "different-kid", "kty": "RSA"}]}
-        mock_get_jwks.return_value = mock_jwks
+        mock_get_signing_key.side_effect = KeyError("test-kid")
 
-        mock_get_header.return_value = {"kid": "test-kid"}
+        mock_peek_kid.return_value = "test-kid"
 
         with pytest.raises(UnauthorizedError, match="Invalid token"):
             validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
 
-    @patch("jscom_common.auth.cognito.get_jwks")
-    @patch("jscom_common.auth.cognito.jwt.get_unverified_header")
-    @patch("jscom_common.auth.cognito.jwt.decode")
+    @patch("jscom_common.auth.cognito.get_signing_key")
+    @patch("jscom_common.auth.cognito._peek_kid")
+    @patch("jscom_common.auth.cognito._verify_fast")
     def test_jwt_decode_error(
         self,
-        mock_decode: MagicMock,
-        mock_get_header: MagicMock,
-        mock_get_jwks: MagicMock,
+        mock_verify: MagicMock,
+        mock_peek_kid: MagicMock,
+        mock_get_signing_key: MagicMock,
     ) -> None:
         """Test that JWT decode error raises UnauthorizedError."""
-        from jose import JWTError
 
         event = {"headers": {"Authorization": "Bearer invalid-token"}}
 
-        mock_jwks = {"keys": [{"kid": "test-kid", "kty": "RSA"}]}
-        mock_get_jwks.return_value = mock_jwks
-
-        mock_get_header.return_value = {"kid": "test-kid"}
+        mock_peek_kid.return_value = "test-kid"
 
-        mock_decode.side_effect = JWTError("Token expired")
+        mock_verify.side_effect = ExpiredSignatureError("Signature has expired")
 
         with pytest.raises(UnauthorizedError, match="Invalid or expired token"):
             validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
 
+    def test_malformed_token_header(self) -> None:
+        """Test that a token with an undecodable header raises UnauthorizedError."""
+        event = {"headers": {"Authorization": "Bearer not-a-jwt"}}
+
+        with pytest.raises(UnauthorizedError, match="Invalid token"):
+            validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
+
     def test_case_insensitive_authorization_header(self) -> None:
         """Test that authorization header is case-insensitive."""
         # Lowercase "authorization"
@@ -157,6 +544,20 @@ class TestValidateJWTToken:
         with pytest.raises(UnauthorizedError):
             validate_jwt_token(event_upper, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
 
+    def test_authorization_header_any_case(self) -> None:
+        """Test that the Authorization header is found regardless of casing."""
+        event = {"headers": {"AUTHORIZATION": "invalid"}}
+
+        with pytest.raises(UnauthorizedError, match="Invalid Authorization header format"):
+            validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
+
+    def test_null_headers(self) -> None:
+        """Test that events with null headers are treated as missing the Authorization header."""
+        event: dict[str, Any] = {"headers": None}
+
+        with pytest.raises(UnauthorizedError, match="Missing Authorization header"):
+            validate_jwt_token(event)
+
     def test_missing_required_parameters(self) -> None:
         """Test that missing required parameters raise ValueError."""
         event = {"headers": {"Authorization": "Bearer token123"}}
@@ -166,3 +567,169 @@ class TestValidateJWTToken:
 
         with pytest.raises(ValueError, match="COGNITO_APP_CLIENT_ID"):
             validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id=None)
+
+
+class TestValidateJWTTokenSigned:
+    """End-to-end tests for validate_jwt_token with RS256-signed tokens."""
+
+    ISSUER = "https://cognito-idp.us-west-2.amazonaws.com/test-pool"
+
+    @pytest.fixture
+    def signed_event(self, private_key: rsa.RSAPrivateKey) -> Any:
+        """Build API Gateway events carrying tokens signed with the test key."""
+        import jscom_common.auth.cognito as cognito_module
+
+        jwk_key = _rsa_jwk(private_key, "test-kid")
+        expires_at = time.time() + 3600
+        cognito_module._jwks_cache[("us-west-2", "test-pool")] = cognito_module._JwksEntry(
+            expires_at, expires_at, {"keys": [jwk_key]}, {"test-kid": jwk_key}, {"test-kid": private_key.public_key()}
+        )
+
+        def _build(**claims: Any) -> dict[str, Any]:
+            # Claims passed as None are left out of the token
+            payload = {"iss": self.ISSUER, "aud": "test-client", "exp": int(time.time()) + 300, **claims}
+            payload = {name: value for name, value in payload.items() if value is not None}
+            token = jwt.encode(payload, private_key, algorithm="RS256", headers={"kid": "test-kid"})
+            return {"headers": {"Authorization": f"Bearer {token}"}}
+
+        return _build
+
+    def test_valid_signed_token(self, signed_event: Any) -> None:
+        """Test that a correctly signed token returns its claims."""
+        claims = validate_jwt_token(
+            signed_event(**{"cognito:username": "testuser"}),
+            region="us-west-2",
+            user_pool_id="test-pool",
+            app_client_id="test-client",
+        )
+
+        assert claims["cognito:username"] == "testuser"
+        assert claims["aud"] == "test-client"
+
+    def test_signed_id_token(self, signed_event: Any) -> None:
+        """Test that a Cognito ID token is validated against its aud claim."""
+        claims = validate_jwt_token(
+            signed_event(token_use="id", email="test@example.com"),
+            region="us-west-2",
+            user_pool_id="test-pool",
+            app_client_id="test-client",
+        )
+
+        assert claims["token_use"] == "id"
+        assert claims["email"] == "test@example.com"
+
+    def test_signed_access_token(self, signed_event: Any) -> None:
+        """Test that a Cognito access token without aud is validated against its client_id claim."""
+        claims = validate_jwt_token(
+            signed_event(token_use="access", client_id="test-client", aud=None, scope="aws.cognito.signin.user.admin"),
+            region="us-west-2",
+            user_pool_id="test-pool",
+            app_client_id="test-client",
+        )
+
+        assert claims["token_use"] == "access"
+        assert "aud" not in claims
+
+    @pytest.mark.parametrize(
+        "claims",
+        [
+            {"token_use": "access", "client_id": "other-client", "aud": None},
+            {"token_use": "access", "aud": None},
+            {"token_use": "id", "client_id": "test-client", "aud": None},
+        ],
+    )
+    def test_signed_token_wrong_client(self, signed_event: Any, claims: dict[str, Any]) -> None:
+        """Test that access tokens for another client and ID tokens without aud are rejected."""
+        with pytest.raises(UnauthorizedError, match="Invalid or expired token"):
+            validate_jwt_token(
+                signed_event(**claims),
+                region="us-west-2",
+                user_pool_id="test-pool",
+                app_client_id="test-client",
+            )
+
+    def test_signed_token_wrong_audience(self, signed_event: Any) -> None:
+        """Test that a token issued for another app client is rejected."""
+        with pytest.raises(UnauthorizedError, match="Invalid or expired token"):
+            validate_jwt_token(
+                signed_event(aud="other-client"),
+                region="us-west-2",
+                user_pool_id="test-pool",
+                app_client_id="test-client",
+            )
+
+    def test_signed_token_expired(self, signed_event: Any) -> None:
+        """Test that an expired token is rejected."""
+        with pytest.raises(UnauthorizedError, match="Invalid or expired token"):
+            validate_jwt_token(
+                signed_event(exp=int(time.time()) - 60),
+                region="us-west-2",
+                user_pool_id="test-pool",
+                app_client_id="test-client",
+            )
+
+    def test_signed_token_wrong_key(self, signed_event: Any) -> None:
+        """Test that a token signed by a different key is rejected."""
+        event = signed_event()
+        other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        payload = {"iss": self.ISSUER, "aud": "test-client", "exp": int(time.time()) + 300}
+        forged = jwt.encode(payload, other_key, algorithm="RS256", headers={"kid": "test-kid"})
+        event["headers"]["Authorization"] = f"Bearer {forged}"
+
+        with pytest.raises(UnauthorizedError, match="Invalid or expired token"):
+            validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
+
+    def test_signed_token_audience_list(self, signed_event: Any) -> None:
+        """Test that an aud claim listing the app client is accepted."""
+        claims = validate_jwt_token(
+            signed_event(aud=["other-client", "test-client"]),
+            region="us-west-2",
+            user_pool_id="test-pool",
+            app_client_id="test-client",
+        )
+
+        assert claims["aud"] == ["other-client", "test-client"]
+
+    @pytest.mark.parametrize(
+        "claims",
+        [
+            {"iss": "https://cognito-idp.us-west-2.amazonaws.com/other-pool"},
+            {"nbf": 4102444800},
+            {"iat": 4102444800},
+            {"exp": None},
+            {"aud": None},
+        ],
+    )
+    def test_signed_token_invalid_claims(self, signed_event: Any, claims: dict[str, Any]) -> None:
+        """Test that wrong issuer, not-yet-valid, and missing required claims are rejected."""
+        event = signed_event(**claims)
+
+        with pytest.raises(UnauthorizedError, match="Invalid or expired token"):
+            validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
+
+    def test_signed_token_mismatched_alg_header(self, signed_event: Any, private_key: rsa.RSAPrivateKey) -> None:
+        """Test that a token declaring another algorithm is rejected even if its signature verifies as RS256."""
+        event = signed_event()
+        _, payload, _ = event["headers"]["Authorization"].removeprefix("Bearer ").split(".")
+        header = base64.urlsafe_b64encode(json.dumps({"alg": "RS512", "kid": "test-kid"}).encode()).rstrip(b"=")
+        signing_input = f"{header.decode()}.{payload}"
+        signature = jwt.algorithms.RSAAlgorithm(jwt.algorithms.RSAAlgorithm.SHA256).sign(
+            signing_input.encode(), private_key
+        )
+        token = f"{signing_input}.{base64.urlsafe_b64encode(signature).rstrip(b'=').decode()}"
+        event["headers"]["Authorization"] = f"Bearer {token}"
+
+        with pytest.raises(UnauthorizedError, match="Invalid token"):
+            validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
+
+    def test_signed_token_tampered_payload(self, signed_event: Any) -> None:
+        """Test that altering the payload invalidates the signature."""
+        event = signed_event()
+        header, _, signature = event["headers"]["Authorization"].removeprefix("Bearer ").split(".")
+        payload = base64.urlsafe_b64encode(
+            json.dumps({"iss": self.ISSUER, "aud": "test-client", "exp": int(time.time()) + 9999}).encode()
+        ).rstrip(b"=")
+        event["headers"]["Authorization"] = f"Bearer {header}.{payload.decode()}.{signature}"
+
+        with pytest.raises(UnauthorizedError, match="Invalid or expired token"):
+            validate_jwt_token(event, region="us-west-2", user_pool_id="test-pool", app_client_id="test-client")
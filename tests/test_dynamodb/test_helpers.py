@@ -2,15 +2,20 @@
 
 import base64
 import json
+from typing import Annotated, Any
 
+import msgpack
 import pytest
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, RootModel, ValidationError, computed_field
 
 from jscom_common.dynamodb.helpers import (
+    _get_fast_dumper,
     decode_pagination_token,
     dynamodb_to_pydantic,
+    dynamodb_to_pydantic_many,
     encode_pagination_token,
     pydantic_to_dynamodb,
+    pydantic_to_dynamodb_many,
 )
 
 
@@ -27,18 +32,41 @@ class TestPaginationTokens:
     """Tests for pagination token encoding/decoding."""
 
     def test_encode_pagination_token(self) -> None:
-        """Test encoding DynamoDB LastEvaluatedKey to base64 token."""
+        """Test encoding DynamoDB LastEvaluatedKey to URL-safe msgpack token."""
         last_key = {"id": "123", "timestamp": 1234567890}
         token = encode_pagination_token(last_key)
 
-        # Token should be base64 encoded
+        # Token should be unpadded URL-safe base64
         assert isinstance(token, str)
         assert len(token) > 0
+        assert not set(token) & set("+/=")
 
         # Should be decodable
-        decoded = base64.b64decode(token.encode("utf-8"))
-        decoded_data = json.loads(decoded.decode("utf-8"))
-        assert decoded_data == last_key
+        padding = "=" * (-len(token) % 4)
+        decoded = base64.urlsafe_b64decode(token + padding)
+        assert msgpack.unpackb(decoded, raw=False) == last_key
+
+    def test_decode_legacy_json_token(self) -> None:
+        """Test decoding legacy base64-encoded JSON tokens from earlier releases."""
+        last_key = {"id": "456", "sort_key": "abc"}
+        legacy_token = base64.b64encode(json.dumps(last_key).encode("utf-8")).decode("utf-8")
+
+        assert decode_pagination_token(legacy_token) == last_key
+
+    def test_decode_unpadded_urlsafe_json_token(self) -> None:
+        """Test decoding URL-safe, unpadded base64 JSON tokens."""
+        last_key = {"pk": "USER#123", "sk": "ITEM>>?"}
+        token = base64.urlsafe_b64encode(json.dumps(last_key).encode("utf-8")).rstrip(b"=").decode("ascii")
+
+        assert "=" not in token
+        assert decode_pagination_token(token) == last_key
+
+    def test_decode_non_dict_token(self) -> None:
+        """Test decoding a token that doesn't contain a dictionary raises ValueError."""
+        token = base64.urlsafe_b64encode(msgpack.packb([1, 2, 3])).decode("ascii")
+
+        with pytest.raises(ValueError, match="Invalid pagination token"):
+            decode_pagination_token(token)
 
     def test_decode_pagination_token(self) -> None:
         """Test decoding base64 token to DynamoDB ExclusiveStartKey."""
@@ -96,6 +124,108 @@ class TestPydanticToDynamoDB:
         assert "age" not in item
 
 
+class NestedModel(BaseModel):
+    """Sample model with a nested model field."""
+
+    id: str
+    owner: SampleModel
+    tags: list[str] = []
+
+
+class ComputedModel(BaseModel):
+    """Sample model with a computed field."""
+
+    first: str
+    last: str
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def full_name(self) -> str:
+        return f"{self.first} {self.last}"
+
+
+class TestFastDumper:
+    """Tests for the flat-model fast path used by pydantic_to_dynamodb."""
+
+    def test_flat_model_uses_fast_path(self) -> None:
+        """Test that scalar-only models get a fast dumper matching model_dump."""
+        dump = _get_fast_dumper(SampleModel)
+        assert dump is not None
+
+        model = SampleModel(id="1", name="John", age=None)
+        assert dump(model) == model.model_dump(exclude_none=True)
+
+    def test_nested_model_falls_back(self) -> None:
+        """Test that nested models are serialized by Pydantic."""
+        assert _get_fast_dumper(NestedModel) is None
+
+        model = NestedModel(id="1", owner=SampleModel(id="2", name="Jane"), tags=["a"])
+        item = pydantic_to_dynamodb(model)
+
+        assert item == {"id": "1", "owner": {"id": "2", "name": "Jane"}, "tags": ["a"]}
+
+    def test_computed_field_falls_back(self) -> None:
+        """Test that computed fields are still included."""
+        assert _get_fast_dumper(ComputedModel) is None
+
+        item = pydantic_to_dynamodb(ComputedModel(first="John", last="Doe"))
+        assert item == {"first": "John", "last": "Doe", "full_name": "John Doe"}
+
+    def test_excluded_and_extra_fields_fall_back(self) -> None:
+        """Test that excluded fields stay excluded and extra fields are kept."""
+
+        class SecretModel(BaseModel):
+            id: str
+            secret: str = Field(exclude=True)
+
+        class ExtraModel(BaseModel):
+            model_config = ConfigDict(extra="allow")
+
+            id: str
+
+        assert _get_fast_dumper(SecretModel) is None
+        assert pydantic_to_dynamodb(SecretModel(id="1", secret="s")) == {"id": "1"}
+
+        assert _get_fast_dumper(ExtraModel) is None
+        assert pydantic_to_dynamodb(ExtraModel.model_validate({"id": "1", "other": "x"})) == {"id": "1", "other": "x"}
+
+    def test_annotated_serializer_falls_back(self) -> None:
+        """Test that serializers attached through Annotated metadata are applied."""
+
+        class DoubledModel(BaseModel):
+            x: Annotated[int, PlainSerializer(lambda v: v * 2)]
+
+        assert _get_fast_dumper(DoubledModel) is None
+        assert pydantic_to_dynamodb(DoubledModel(x=2)) == {"x": 4}
+
+    def test_aliased_fields_fall_back(self) -> None:
+        """Test that models serializing by alias keep their aliased keys."""
+
+        class AliasModel(BaseModel):
+            model_config = ConfigDict(serialize_by_alias=True)
+
+            x: int = Field(alias="X")
+
+        class SerializationAliasModel(BaseModel):
+            x: int = Field(serialization_alias="X")
+
+        assert _get_fast_dumper(AliasModel) is None
+        assert pydantic_to_dynamodb(AliasModel.model_validate({"X": 1})) == {"X": 1}
+
+        assert _get_fast_dumper(SerializationAliasModel) is None
+        item = pydantic_to_dynamodb(SerializationAliasModel(x=1))
+        assert item == SerializationAliasModel(x=1).model_dump(exclude_none=True)
+
+    def test_root_model_falls_back(self) -> None:
+        """Test that RootModel subclasses dump their root value, not a dict."""
+
+        class ScoreModel(RootModel[int]):
+            pass
+
+        assert _get_fast_dumper(ScoreModel) is None
+        assert pydantic_to_dynamodb(ScoreModel(3)) == 3
+
+
 class TestDynamoDBToPydantic:
     """Tests for DynamoDB item to Pydantic model conversion."""
 
@@ -134,6 +264,64 @@ class TestDynamoDBToPydantic:
             dynamodb_to_pydantic(item, SampleModel)
 
 
+class TestBatchConversion:
+    """Tests for batch Pydantic/DynamoDB conversions."""
+
+    def test_pydantic_to_dynamodb_many(self) -> None:
+        """Test converting a batch of models excludes None values per item."""
+        models = [
+            SampleModel(id="1", name="John", email="john@example.com"),
+            SampleModel(id="2", name="Jane", age=30),
+        ]
+        items = pydantic_to_dynamodb_many(models)
+
+        assert items == [
+            {"id": "1", "name": "John", "email": "john@example.com"},
+            {"id": "2", "name": "Jane", "age": 30},
+        ]
+
+    def test_pydantic_to_dynamodb_many_mixed_subclasses(self) -> None:
+        """Test that subclass instances in a batch are dumped through their own class."""
+
+        class AdminModel(SampleModel):
+            password_hash: str = Field(exclude=True)
+
+        class OwnedModel(SampleModel):
+            owner: SampleModel
+
+        models = [
+            SampleModel(id="1", name="John"),
+            AdminModel(id="2", name="Jane", password_hash="secret"),
+            OwnedModel(id="3", name="Bob", owner=SampleModel(id="4", name="Ann")),
+        ]
+        items = pydantic_to_dynamodb_many(models)
+
+        assert items == [
+            {"id": "1", "name": "John"},
+            {"id": "2", "name": "Jane"},
+            {"id": "3", "name": "Bob", "owner": {"id": "4", "name": "Ann"}},
+        ]
+        assert items == [model.model_dump(exclude_none=True) for model in models]
+
+    def test_pydantic_to_dynamodb_many_empty(self) -> None:
+        """Test converting an empty batch."""
+        assert pydantic_to_dynamodb_many([]) == []
+
+    def test_dynamodb_to_pydantic_many(self) -> None:
+        """Test converting a batch of items to models."""
+        items: list[dict[str, Any]] = [{"id": "1", "name": "John"}, {"id": "2", "name": "Jane", "age": 30}]
+        models = dynamodb_to_pydantic_many(items, SampleModel)
+
+        assert models == [SampleModel(id="1", name="John"), SampleModel(id="2", name="Jane", age=30)]
+
+    def test_dynamodb_to_pydantic_many_validation_error(self) -> None:
+        """Test that an invalid item in the batch raises ValidationError."""
+        items: list[dict[str, Any]] = [{"id": "1", "name": "John"}, {"id": "2"}]
+
+        with pytest.raises(ValidationError):
+            dynamodb_to_pydantic_many(items, SampleModel)
+
+
 class TestRoundtripConversion:
     """Tests for roundtrip conversions between Pydantic and DynamoDB."""
 
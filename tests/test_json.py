@@ -0,0 +1,33 @@
+"""Tests for shared JSON parsing helpers."""
+
+import pytest
+
+from jscom_common import _json
+
+
+class TestJsonHelpers:
+    """Tests for loads with and without orjson."""
+
+    def test_loads_bytes_and_str(self) -> None:
+        """Test that loads accepts both bytes and str documents."""
+        data = {"id": "123", "count": 2, "tags": ["a", "b"]}
+        encoded = b'{"id":"123","count":2,"tags":["a","b"]}'
+
+        assert _json.loads(encoded) == data
+        assert _json.loads(encoded.decode("utf-8")) == data
+
+    def test_stdlib_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the stdlib fallback parses identically."""
+        encoded = b'{"id":"123","count":2}'
+        expected = _json.loads(encoded)
+
+        monkeypatch.setattr(_json, "orjson", None)
+
+        assert _json.loads(encoded) == expected
+        with pytest.raises(ValueError):
+            _json.loads(b"not-json")
+
+    def test_invalid_json_raises_value_error(self) -> None:
+        """Test that invalid JSON raises ValueError."""
+        with pytest.raises(ValueError):
+            _json.loads(b"not-json")
@@ -1,8 +1,12 @@
 """Tests for API response models."""
 
+import json
+from typing import Any
+
+import pytest
 from pydantic import BaseModel
 
-from jscom_common.models import ApiResponse, PaginatedResponse
+from jscom_common.models import ApiResponse, PaginatedResponse, error_response_bytes
 
 
 class SampleData(BaseModel):
@@ -109,3 +113,44 @@ class TestPaginatedResponse:
         assert serialized["count"] == 1
         assert len(serialized["items"]) == 1
         assert serialized["next_token"] == "xyz"
+
+
+class TestPrebuiltModels:
+    """Tests for parameterizations built at import time."""
+
+    def test_common_parameterizations_prebuilt(self) -> None:
+        """Test that common parameterizations are complete and reused."""
+        from jscom_common.models.api_response import _PREBUILT_MODELS
+
+        for model in (ApiResponse[dict[str, Any]], ApiResponse[None], PaginatedResponse[dict[str, Any]]):
+            assert model in _PREBUILT_MODELS
+            assert model.__pydantic_complete__
+
+    def test_extra_fields_ignored(self) -> None:
+        """Test that unknown fields are ignored rather than rejected."""
+        response = ApiResponse[None].model_validate({"status": 200, "unexpected": "value"})
+
+        assert response.status == 200
+        assert not hasattr(response, "unexpected")
+
+
+class TestErrorResponseBytes:
+    """Tests for pre-serialized error envelopes."""
+
+    def test_error_response_bytes(self) -> None:
+        """Test that envelopes match the serialized ApiResponse model."""
+        body = error_response_bytes(401)
+
+        assert isinstance(body, bytes)
+        assert json.loads(body) == {"status": 401, "error": "Unauthorized"}
+        assert body == ApiResponse[None](status=401, error="Unauthorized").model_dump_json(exclude_none=True).encode()
+
+    def test_error_response_bytes_server_error(self) -> None:
+        """Test a 5xx envelope."""
+        assert json.loads(error_response_bytes(500)) == {"status": 500, "error": "Internal Server Error"}
+
+    def test_error_response_bytes_unknown_status(self) -> None:
+        """Test that non-error or unknown statuses raise ValueError."""
+        for status in (200, 302, 599):
+            with pytest.raises(ValueError, match="Not a known HTTP error status"):
+                error_response_bytes(status)